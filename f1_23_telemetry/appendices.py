@@ -3,6 +3,10 @@ More info is available here:
 https://answers.ea.com/t5/General-Discussion/F1-23-UDP-Specification/td-p/12632888?attachment-id=704910
 """
 
+import sys
+import types
+from enum import IntEnum
+
 TEAM_IDS = {
     0: 'Mercedes',
     1: 'Ferrari',
@@ -600,6 +604,13 @@ LAP_VALID_BIT_FLAGS = {
     '0x08': 'Sector 3 valid',
 }
 
+# Bits of lap_valid_bit_flags in the order lap, sector 1, sector 2, sector 3.
+LAP_VALID_MASK = (0x01, 0x02, 0x04, 0x08)
+
+# (lap valid, sector 1 valid, sector 2 valid, sector 3 valid) for every value of the low nibble,
+# use as LAP_VALID_DECODE[lap_valid_bit_flags & 0x0F].
+LAP_VALID_DECODE = tuple(tuple(flags & mask != 0 for mask in LAP_VALID_MASK) for flags in range(16))
+
 VEHICLE_FIA_FLAGS = {
     -1: 'Invalid/unknown',
     0: 'None',
@@ -697,3 +708,150 @@ DRS = {
     0: 'Off',
     1: 'On',
 }
+
+
+def _freeze(mapping):
+    """Returns a read only view of ``mapping`` with its labels interned"""
+    return types.MappingProxyType({key: sys.intern(value) for key, value in mapping.items()})
+
+
+# The appendices are constant for the lifetime of the process, freeze them so they can't be mutated by accident.
+for _name, _value in list(globals().items()):
+    if _name.isupper() and isinstance(_value, dict):
+        globals()[_name] = _freeze(_value)
+
+del _name, _value
+
+
+def _build_table(mapping):
+    """Returns a ``tuple`` indexed by the mapping's keys, ``None`` fills any gaps"""
+    table = [None] * (max(mapping) + 1)
+
+    for key, value in mapping.items():
+        table[key] = value
+
+    return tuple(table)
+
+
+def _build_list(mapping):
+    """Returns a ``list`` of labels indexed by the mapping's keys, empty strings fill any gaps"""
+    return [mapping.get(key, '') for key in range(max(mapping) + 1)]
+
+
+def lookup(table, key):
+    """Returns the value for ``key`` in a table built by ``_build_table`` or ``None`` if unknown"""
+    return table[key] if 0 <= key < len(table) else None
+
+
+# Direct mapped cache of (name, driver id) pairs, filled as names are looked up rather than building a reverse dict.
+_DRIVER_NAME_CACHE = [None] * 512
+
+
+def driver_id_by_name(name):
+    """Returns the first driver id in DRIVER_IDS with the given name, or ``None`` if there isn't one"""
+    slot = hash(name) % len(_DRIVER_NAME_CACHE)
+    cached = _DRIVER_NAME_CACHE[slot]
+
+    if cached is not None and cached[0] == name:
+        return cached[1]
+
+    for driver_id, driver_name in DRIVER_IDS.items():
+        if driver_name == name:
+            _DRIVER_NAME_CACHE[slot] = (name, driver_id)
+            return driver_id
+
+    return None
+
+
+# Tuple based versions of the id lookups above, these avoid hashing the id on every packet decoded.
+TEAM_IDS_TBL = _build_table(TEAM_IDS)
+DRIVER_IDS_TBL = _build_table(DRIVER_IDS)
+TRACK_IDS_TBL = _build_table(TRACK_IDS)
+NATIONALITY_IDS_TBL = _build_table(NATIONALITY_IDS)
+GAME_MODE_IDS_TBL = _build_table(GAME_MODE_IDS)
+RULESET_IDS_TBL = _build_table(RULESET_IDS)
+SURFACE_TYPES_TBL = _build_table(SURFACE_TYPES)
+PENALTY_TYPES_TBL = _build_table(PENALTY_TYPES)
+INFRINGEMENT_TYPES_TBL = _build_table(INFRINGEMENT_TYPES)
+ACTUAL_TYRE_COMPOUND_TBL = _build_table(ACTUAL_TYRE_COMPOUND)
+VISUAL_TYRE_COMPOUND_TBL = _build_table(VISUAL_TYRE_COMPOUND)
+WEATHER_TBL = _build_table(WEATHER)
+SESSION_TYPE_TBL = _build_table(SESSION_TYPE)
+FORMULA_TBL = _build_table(FORMULA)
+DRIVER_STATUS_TBL = _build_table(DRIVER_STATUS)
+RESULT_STATUS_TBL = _build_table(RESULT_STATUS)
+
+# Plain lists of labels for jitted code such as numba, which compiles list indexing into a direct load but handles
+# dicts and None gaps poorly. Use these rather than the dicts or tables inside @numba.njit functions.
+TEAM_IDS_LIST = _build_list(TEAM_IDS)
+DRIVER_IDS_LIST = _build_list(DRIVER_IDS)
+TRACK_IDS_LIST = _build_list(TRACK_IDS)
+NATIONALITY_IDS_LIST = _build_list(NATIONALITY_IDS)
+SURFACE_TYPES_LIST = _build_list(SURFACE_TYPES)
+PENALTY_TYPES_LIST = _build_list(PENALTY_TYPES)
+INFRINGEMENT_TYPES_LIST = _build_list(INFRINGEMENT_TYPES)
+ACTUAL_TYRE_COMPOUND_LIST = _build_list(ACTUAL_TYRE_COMPOUND)
+VISUAL_TYRE_COMPOUND_LIST = _build_list(VISUAL_TYRE_COMPOUND)
+WEATHER_LIST = _build_list(WEATHER)
+SESSION_TYPE_LIST = _build_list(SESSION_TYPE)
+DRIVER_STATUS_LIST = _build_list(DRIVER_STATUS)
+RESULT_STATUS_LIST = _build_list(RESULT_STATUS)
+
+
+# Int backed statuses for code that only compares values, use ``label()`` to get the appendix text for display.
+class DriverStatus(IntEnum):
+    IN_GARAGE = 0
+    FLYING_LAP = 1
+    IN_LAP = 2
+    OUT_LAP = 3
+    ON_TRACK = 4
+
+    def label(self):
+        return DRIVER_STATUS[self]
+
+
+class PitStatus(IntEnum):
+    NONE = 0
+    PITTING = 1
+    IN_PIT_AREA = 2
+
+    def label(self):
+        return PIT_STATUS[self]
+
+
+class SafetyCarStatus(IntEnum):
+    NO_SAFETY_CAR = 0
+    FULL = 1
+    VIRTUAL = 2
+    FORMATION_LAP = 3
+
+    def label(self):
+        return SAFETY_CAR_STATUS[self]
+
+
+class VehicleFiaFlag(IntEnum):
+    INVALID_UNKNOWN = -1
+    NONE = 0
+    GREEN = 1
+    BLUE = 2
+    YELLOW = 3
+    RED = 4
+
+    def label(self):
+        return VEHICLE_FIA_FLAGS[self]
+
+
+class Drs(IntEnum):
+    OFF = 0
+    ON = 1
+
+    def label(self):
+        return DRS[self]
+
+
+class PitAssist(IntEnum):
+    OFF = 0
+    ON = 1
+
+    def label(self):
+        return PIT_ASSIST[self]
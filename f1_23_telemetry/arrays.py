@@ -0,0 +1,369 @@
+"""
+Optional numpy views over packets for bulk and vectorised consumers.
+
+Requires numpy, install with ``pip install f1-23-telemetry[numpy]``.
+"""
+
+import ctypes
+import functools
+
+import numpy as np
+
+from f1_23_telemetry import appendices
+from f1_23_telemetry.packets import (
+    CAR_ARRAY_FIELDS,
+    CarMotionData,
+    CarTelemetryData,
+    LapHistoryData,
+    PacketCarTelemetryData,
+    PacketHeader,
+    PacketLapData,
+    PacketMotionData,
+    PacketMotionExData,
+    PacketSessionHistoryData,
+    _fields,
+)
+
+
+def _simple_dtype(ctype):
+    """Returns the little endian numpy dtype for a ctypes scalar type"""
+    return np.dtype(ctype._type_).newbyteorder('<')
+
+
+@functools.lru_cache(maxsize=None)
+def dtype(packet_type):
+    """Returns a numpy structured dtype matching the packed wire layout of a packet type
+
+    Args:
+        packet_type (type):
+            - A ``Packet`` subclass, ctypes array or ctypes scalar type
+
+    """
+    if issubclass(packet_type, ctypes.Array):
+        if packet_type._type_ is ctypes.c_char:
+            return np.dtype(f'S{packet_type._length_}')
+
+        return np.dtype((dtype(packet_type._type_), (packet_type._length_,)))
+
+    if issubclass(packet_type, (ctypes.Structure, ctypes.Union)):
+        # Later fields shadow earlier ones with the same name, as they do on the ctypes class.
+        fields = dict(packet_type._fields_)
+        names = list(fields)
+
+        return np.dtype(
+            {
+                'names': names,
+                'formats': [dtype(ctype) for ctype in fields.values()],
+                'offsets': [getattr(packet_type, name).offset for name in names],
+                'itemsize': ctypes.sizeof(packet_type),
+            }
+        )
+
+    return _simple_dtype(packet_type)
+
+
+@functools.lru_cache(maxsize=None)
+def aligned_dtype(packet_type):
+    """Returns a numpy structured dtype with the fields of ``packet_type`` at their natural, aligned offsets
+
+    Packets are packed on the wire, which leaves fields such as ``session_uid`` at odd offsets. Copying into this
+    layout once lets analytics code run vector operations on aligned data, which matters on ARM. Unions keep their
+    packed layout.
+
+    Args:
+        packet_type (type):
+            - A ``Packet`` subclass, ctypes array or ctypes scalar type
+
+    """
+    if issubclass(packet_type, ctypes.Array):
+        if packet_type._type_ is ctypes.c_char:
+            return np.dtype(f'S{packet_type._length_}')
+
+        return np.dtype((aligned_dtype(packet_type._type_), (packet_type._length_,)))
+
+    if issubclass(packet_type, ctypes.Union):
+        return dtype(packet_type)
+
+    if issubclass(packet_type, ctypes.Structure):
+        fields = dict(packet_type._fields_)
+
+        return np.dtype(
+            {'names': list(fields), 'formats': [aligned_dtype(ctype) for ctype in fields.values()]},
+            align=True,
+        )
+
+    return _simple_dtype(packet_type)
+
+
+def frombuffer(packet_type, buffer, count=1, offset=0):
+    """Returns a structured array viewing ``count`` packets of ``packet_type`` in ``buffer``, no data is copied
+
+    Args:
+        packet_type (type):
+            - The ``Packet`` subclass laid out in the buffer
+        buffer (bytes):
+            - The encoded buffer to view
+        count (int):
+            - Number of consecutive packets to view
+        offset (int):
+            - Byte offset of the first packet
+
+    """
+    return np.frombuffer(buffer, dtype=dtype(packet_type), count=count, offset=offset)
+
+
+def to_aligned(packet):
+    """Returns a copy of a packet as a one element structured array with the ``aligned_dtype`` layout
+
+    Args:
+        packet (Packet):
+            - The packet to copy
+
+    """
+    packet_type = type(packet)
+
+    return frombuffer(packet_type, packet).astype(aligned_dtype(packet_type))
+
+
+def field_array(packet_type, field, buffer, offset=0):
+    """Returns an array field of a packet, such as the data for all 22 cars, as a view over ``buffer``
+
+    Args:
+        packet_type (type):
+            - The ``Packet`` subclass laid out in the buffer
+        field (str):
+            - Name of an array field in the packet's _fields_
+        buffer (bytes):
+            - The encoded buffer to view
+        offset (int):
+            - Byte offset of the packet in the buffer
+
+    """
+    array_type = dict(packet_type._fields_)[field]
+
+    return np.frombuffer(
+        buffer,
+        dtype=dtype(array_type._type_),
+        count=array_type._length_,
+        offset=offset + getattr(packet_type, field).offset,
+    )
+
+
+def car_array(packet_type, buffer, offset=0):
+    """Returns the entries for all 22 cars of a packet as one contiguous structured array viewing ``buffer``
+
+    Reductions across the grid such as ``car_array(PacketCarTelemetryData, data)['speed'].max()`` run in numpy, with no
+    Python object created per car.
+
+    Args:
+        packet_type (type):
+            - A ``Packet`` subclass in ``CAR_ARRAY_FIELDS``, such as ``PacketCarTelemetryData``
+        buffer (bytes):
+            - The encoded buffer to view, or a packet of ``packet_type``
+        offset (int):
+            - Byte offset of the packet in the buffer
+
+    """
+    return field_array(packet_type, CAR_ARRAY_FIELDS[packet_type], buffer, offset)
+
+
+def car_motion_array(buffer, offset=0):
+    """Returns the ``CarMotionData`` of every car in a motion packet as a view over ``buffer``"""
+    return field_array(PacketMotionData, 'car_motion_data', buffer, offset)
+
+
+def lap_data_array(buffer, offset=0):
+    """Returns the ``LapData`` of every car in a lap data packet as a view over ``buffer``"""
+    return field_array(PacketLapData, 'lap_data', buffer, offset)
+
+
+def car_telemetry_array(buffer, offset=0):
+    """Returns the ``CarTelemetryData`` of every car in a car telemetry packet as a view over ``buffer``"""
+    return field_array(PacketCarTelemetryData, 'car_telemetry_data', buffer, offset)
+
+
+def lap_history_array(buffer, offset=0):
+    """Returns the ``LapHistoryData`` of the laps in a session history packet as a view over ``buffer``
+
+    Only the first ``num_laps`` of the 100 entries are included, columns such as ``['sector2_time_in_ms']`` are
+    contiguous per field reads with no ``LapHistoryData`` created for each lap.
+    """
+    laps = field_array(PacketSessionHistoryData, 'lap_history_data', buffer, offset)
+
+    return laps[: buffer[offset + PacketSessionHistoryData.num_laps.offset]]
+
+
+# The per wheel float[4] fields of the extended motion packet, each in RL, RR, FL, FR order.
+WHEEL_FIELDS = tuple(
+    name
+    for name, ctype in _fields(PacketMotionExData)
+    if issubclass(ctype, ctypes.Array) and ctype._type_ is ctypes.c_float and ctype._length_ == 4
+)
+
+
+def wheel_array(field, buffer, offset=0):
+    """Returns one per wheel field of an extended motion packet as a four element float32 view over ``buffer``
+
+    ``numpy.linalg.norm(wheel_array('m_wheelVertForce', data))`` needs no Python loop over the wheels.
+
+    Args:
+        field (str):
+            - One of ``WHEEL_FIELDS``, such as ``'m_wheelSpeed'``
+        buffer (bytes):
+            - The encoded buffer to view
+        offset (int):
+            - Byte offset of the packet in the buffer
+
+    """
+    return field_array(PacketMotionExData, field, buffer, offset)
+
+
+def wheel_arrays(buffer, offset=0):
+    """Returns a ``dict`` of every field in ``WHEEL_FIELDS`` as a view over an encoded extended motion packet"""
+    return {field: field_array(PacketMotionExData, field, buffer, offset) for field in WHEEL_FIELDS}
+
+
+def columns(array):
+    """Returns a ``dict`` of each field of a structured array as its own array, views over the same memory
+
+    ``columns(car_telemetry_array(data))['speed']`` is the speed of all 22 cars.
+
+    Args:
+        array (numpy.ndarray):
+            - A structured array, such as ``car_telemetry_array``
+
+    """
+    return {name: array[name] for name in array.dtype.names}
+
+
+def rounded(array, decimals=3):
+    """Returns a copy of a structured array with its float fields widened to float64 and rounded like ``to_dict``
+
+    The result is ready for ``tolist`` when exporting to JSON.
+    """
+    names = array.dtype.names
+    floats = {name for name in names if array.dtype[name].kind == 'f'}
+    formats = [(name, np.float64 if name in floats else array.dtype[name]) for name in names]
+    result = np.empty(array.shape, dtype=formats)
+
+    for name in names:
+        if name in floats:
+            result[name] = np.round(array[name].astype(np.float64), decimals)
+        else:
+            result[name] = array[name]
+
+    return result
+
+
+# Largest finite float16, the tyre pressures are clamped to it rather than becoming infinite.
+_FLOAT16_MAX = float(np.finfo(np.float16).max)
+
+
+def _quantise(values, scale, low, high):
+    """Scales and rounds ``values`` into ``low`` to ``high``, NaN becomes 0"""
+    return np.rint(np.clip(np.nan_to_num(values.astype(np.float64) * scale, nan=0.0), low, high))
+
+
+def compact_car_telemetry(array):
+    """Returns the driver inputs and tyre pressures of a ``car_telemetry_array`` quantised like ``to_compact``
+
+    Throttle and brake become uint8 from 0 to 255, steer int8 from -127 to 127 and the tyre pressures float16, a
+    quarter to a half of the bytes of the float32 columns for storage or rebroadcasting. Each row has the same 18 byte
+    layout as ``to_compact``, so ``tobytes()`` of the result is the compact form of every car in turn. Values out of
+    range are clamped into it and NaN becomes 0, as in ``to_compact``.
+
+    Args:
+        array (numpy.ndarray):
+            - A structured array of ``CarTelemetryData``, such as ``car_telemetry_array``
+
+    """
+    result = np.empty(array.shape, dtype=COMPACT_CAR_TELEMETRY_DTYPE)
+
+    result['speed'] = array['speed']
+    result['throttle'] = _quantise(array['throttle'], 255, 0, 255)
+    result['steer'] = _quantise(array['steer'], 127, -127, 127)
+    result['brake'] = _quantise(array['brake'], 255, 0, 255)
+    result['clutch'] = array['clutch']
+    result['gear'] = array['gear']
+    result['engine_rpm'] = array['engine_rpm']
+    result['drs'] = array['drs']
+    result['tyres_pressure'] = np.clip(np.nan_to_num(array['tyres_pressure'], nan=0.0), -_FLOAT16_MAX, _FLOAT16_MAX)
+
+    return result
+
+
+class MotionRing:
+    """Keeps the most recent motion packets as rows of a ``(capacity, 22)`` structured array
+
+    Columns such as ``ring.column('g_force_lateral')`` are ``(rows, 22)`` arrays ready for vectorised filtering.
+
+    Args:
+        capacity (int):
+            - Number of motion packets to keep, older packets are overwritten
+    """
+
+    def __init__(self, capacity):
+        self.data = np.zeros((capacity, 22), dtype(CarMotionData))
+        self.session_time = np.zeros(capacity, dtype=np.float32)
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, len(self.data))
+
+    def append(self, buffer, offset=0):
+        """Copies the car motion data of an encoded motion packet into the next row"""
+        row = self.count % len(self.data)
+
+        self.data[row] = car_motion_array(buffer, offset)
+        self.session_time[row] = frombuffer(PacketHeader, buffer, offset=offset)['session_time'][0]
+        self.count += 1
+
+    def column(self, name):
+        """Returns a field for every stored packet and car, oldest packet first"""
+        return self._ordered(self.data[name])
+
+    def times(self):
+        """Returns the session time of every stored packet, oldest first"""
+        return self._ordered(self.session_time)
+
+    def _ordered(self, rows):
+        if self.count <= len(rows):
+            return rows[: self.count]
+
+        return np.roll(rows, -(self.count % len(rows)), axis=0)
+
+
+HEADER_DTYPE = dtype(PacketHeader)
+CAR_TELEMETRY_DTYPE = dtype(CarTelemetryData)
+LAP_HISTORY_DTYPE = dtype(LapHistoryData)
+COMPACT_CAR_TELEMETRY_DTYPE = np.dtype(
+    [
+        ('speed', '<u2'),
+        ('throttle', 'u1'),
+        ('steer', 'i1'),
+        ('brake', 'u1'),
+        ('clutch', 'u1'),
+        ('gear', 'i1'),
+        ('engine_rpm', '<u2'),
+        ('drs', 'u1'),
+        ('tyres_pressure', '<f2', (4,)),
+    ]
+)
+
+
+def label_array(labels):
+    """Returns an object array of appendix labels, index it with an array of ids to look them all up in one go
+
+    Args:
+        labels (list):
+            - One of the ``*_LIST`` label lists from the appendices
+
+    """
+    return np.array(labels, dtype=object)
+
+
+TEAM_IDS_ARRAY = label_array(appendices.TEAM_IDS_LIST)
+DRIVER_IDS_ARRAY = label_array(appendices.DRIVER_IDS_LIST)
+TRACK_IDS_ARRAY = label_array(appendices.TRACK_IDS_LIST)
+SURFACE_TYPES_ARRAY = label_array(appendices.SURFACE_TYPES_LIST)
+INFRINGEMENT_TYPES_ARRAY = label_array(appendices.INFRINGEMENT_TYPES_LIST)
@@ -2,28 +2,247 @@
 Basic listener to read the UDP packet and convert it to a known packet format.
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ctypes
 import socket
-from typing import Optional
 
-from f1_23_telemetry.packets import PacketHeader, HEADER_FIELD_TO_PACKET_TYPE
+from f1_23_telemetry.packets import (
+    CAR_ARRAY_FIELDS,
+    HEADER_KEY_STRUCT,
+    PACKET_BY_ID,
+    PACKET_FORMAT,
+    PACKET_ID_OFFSET,
+    PACKET_UNPACK_FROM_BY_ID,
+    PACKET_VERSION,
+    PacketHeader,
+)
+
+_unpack_header_key = HEADER_KEY_STRUCT.unpack_from
+_HEADER_KEY_SIZE = HEADER_KEY_STRUCT.size
+
+# Room for bursts of packets to queue up in the kernel while the caller is busy decoding.
+_RECEIVE_BUFFER_SIZE = 2 << 20
+
+# Batched receivers drain a lot more per wake up, give them room for several frames of every packet type.
+_BATCHED_RECEIVE_BUFFER_SIZE = 12 << 20
+
+
+def _lookup(packet, table):
+    """Returns the entry of a table indexed by packet id like PACKET_BY_ID, raises KeyError for unknown packets
+
+    Raises ValueError for a datagram too short to hold the header fields, as the packet types do when it is too short
+    for the packet.
+    """
+    if len(packet) < _HEADER_KEY_SIZE:
+        raise ValueError(f"A packet header needs {_HEADER_KEY_SIZE} bytes, received {len(packet)}")
+
+    packet_format, packet_version, packet_id = _unpack_header_key(packet)
+
+    if packet_format != PACKET_FORMAT or packet_version != PACKET_VERSION or packet_id >= len(table):
+        raise KeyError((packet_format, packet_version, packet_id))
+
+    return table[packet_id]
+
+
+def _unpack(packet, unpack_table):
+    return _lookup(packet, unpack_table)(packet)
+
+
+@contextlib.contextmanager
+def _non_blocking(sock):
+    """Puts a socket in non blocking mode for the duration, then restores the timeout it had before"""
+    timeout = sock.gettimeout()
+    sock.setblocking(False)
+
+    try:
+        yield
+    finally:
+        sock.settimeout(timeout)
+
+
+def _car_views(packet_type, buffer):
+    """Returns a view of each per car entry of a packet type over ``buffer``, empty for packets without per car data"""
+    field = CAR_ARRAY_FIELDS.get(packet_type)
+
+    if field is None:
+        return ()
+
+    entry_type = dict(packet_type._fields_)[field]._type_
+    start = getattr(packet_type, field).offset
+
+    return tuple(entry_type.from_buffer(buffer, start + car * ctypes.sizeof(entry_type)) for car in range(22))
 
 
 class TelemetryListener:
-    def __init__(self, host: Optional[str] = None, port: Optional[int] = None):
+    def __init__(self, host: str | None = None, port: int | None = None):
         # Set to default port used by the game in telemetry setup.
-        if not port:
-            port = 20777
-
-        if not host:
-            host = '0.0.0.0'
+        port = 20777 if port is None else port
+        host = '0.0.0.0' if host is None else host
 
         self.socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        self.socket.setblocking(True)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECEIVE_BUFFER_SIZE)
         self.socket.bind((host, port))
 
+        # Reused for every datagram, packets are copied out of it when unpacked.
+        self._buffer = bytearray(2048)
+        self._recv_into = self.socket.recv_into
+
+        # A view over the start of the buffer, always reflects the header of the most recently received packet.
+        # Copy it if it needs to outlive the next call to get().
+        self.header = PacketHeader.from_buffer(self._buffer)
+
+        # One view of each packet type over the buffer, get(copy=False) hands these out rather than creating new ones.
+        self._scratch = tuple(packet_type.from_buffer(self._buffer) for packet_type in PACKET_BY_ID)
+
+        # Views of the 22 per car entries of each packet type over the buffer, a pool that every receive refills.
+        self._cars = tuple(_car_views(packet_type, self._buffer) for packet_type in PACKET_BY_ID)
+
+    def get(self, copy: bool = True):
+        """Waits for the next packet and unpacks it
+
+        Args:
+            copy (bool):
+                - When ``False`` the packet is a view over the listener's receive buffer rather than a copy, it is only
+                  valid until the next packet is received. The same view is returned for every packet of a type, so
+                  nothing is allocated per packet.
+
+        """
+        packet = self._received(self._recv_into(self._buffer))
+
+        # Copying from the view reads exactly the packet's bytes, no slice of the buffer is needed.
+        return type(packet).from_buffer_copy(packet) if copy else packet
+
+    def get_cars(self):
+        """Waits for the next packet and returns it with its per car entries, as ``(packet, cars)``
+
+        Both are views over the receive buffer, as with ``get(copy=False)``, and are only valid until the next packet is
+        received. ``cars`` is a ``tuple`` of the same 22 entry views for every packet of a type, so reading each car
+        allocates nothing. It is empty for packets without per car data.
+        """
+        packet = self._received(self._recv_into(self._buffer))
+
+        return packet, self._cars[self._buffer[PACKET_ID_OFFSET]]
+
+    def get_batch(self, max_packets: int = 32):
+        """Waits for a packet then returns it along with any others already queued, up to ``max_packets``
+
+        Queued datagrams that are not a known packet, or are too short, are skipped so the packets already collected
+        are still returned. The socket's timeout is left as it was.
+        """
+        return self._get_queued([self.get()], max_packets)
+
+    def _get_queued(self, packets, max_packets):
+        """Adds the packets already queued on the socket to ``packets`` without waiting, up to ``max_packets`` in all
+
+        Datagrams that are not a known packet, or are too short, are skipped. The socket's timeout is left as it was.
+        """
+        with _non_blocking(self.socket):
+            while len(packets) < max_packets:
+                try:
+                    packets.append(self.get())
+                except BlockingIOError:
+                    break
+                except (KeyError, ValueError):
+                    continue
+
+        return packets
+
+    def _received(self, size):
+        """Returns the view of the packet just received into the buffer, checking its type is known and its size"""
+        packet = _lookup(self._buffer, self._scratch)
+
+        if size < packet._SIZE:
+            raise ValueError(f"{type(packet).__name__} needs {packet._SIZE} bytes, received {size}")
+
+        return packet
+
+    async def iter_packets(self, max_packets: int = 32):
+        """Yields packets as they arrive, for use inside an asyncio event loop
+
+        Each time the socket is readable the packets queued on it are received together, up to ``max_packets``, as in
+        ``get_batch``, then yielded one by one. Datagrams that are not a known packet, or are too short, are skipped.
+        Breaking out of the ``async for`` drops the rest of the packets received together. Between batches no reader is
+        registered and the socket's timeout is as it was. Waiting relies on ``loop.add_reader`` so needs a selector
+        based event loop.
+        """
+        loop = asyncio.get_running_loop()
+        fileno = self.socket.fileno()
+
+        while True:
+            packets = self._get_queued([], max_packets)
+
+            if not packets:
+                readable = loop.create_future()
+                loop.add_reader(fileno, readable.set_result, None)
+
+                try:
+                    await readable
+                finally:
+                    loop.remove_reader(fileno)
+
+                continue
+
+            for packet in packets:
+                yield packet
+
+
+class BatchedReceiver:
+    """Receives datagrams in batches into preallocated buffers, for sockets carrying a high packet rate
+
+    Python has no ``recvmmsg``, so each batch is one blocking receive followed by non blocking receives until the
+    socket is empty or the batch is full. Every datagram gets its own buffer so a whole batch can be decoded zero copy.
+
+    Args:
+        sock (socket.socket):
+            - A bound UDP socket, such as ``TelemetryListener.socket``
+        batch (int):
+            - Most datagrams returned by one call
+        mtu (int):
+            - Size of each receive buffer, larger datagrams are truncated
+    """
+
+    def __init__(self, sock: socket.socket, batch: int = 43, mtu: int = 2048):
+        self.socket = sock
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _BATCHED_RECEIVE_BUFFER_SIZE)
+
+        self._buffers = [bytearray(mtu) for _ in range(batch)]
+        self._views = [memoryview(buffer) for buffer in self._buffers]
+        self._recv_into = sock.recv_into
+
+    def receive(self):
+        """Waits for a datagram then returns it along with any others already queued, as views over the buffers
+
+        The views are only valid until the next call. The socket's timeout is left as it was.
+        """
+        recv_into = self._recv_into
+        views = self._views
+        received = [views[0][: recv_into(self._buffers[0])]]
+
+        with _non_blocking(self.socket):
+            try:
+                for buffer, view in zip(self._buffers[1:], views[1:]):
+                    received.append(view[: recv_into(buffer)])
+            except BlockingIOError:
+                pass
+
+        return received
+
     def get(self):
-        packet = self.socket.recv(2048)
-        header = PacketHeader.from_buffer_copy(packet)
+        """Receives a batch and unpacks every packet in it, the packets are views only valid until the next call
+
+        Datagrams that are not a known packet, or are too short, are left out rather than failing the whole batch.
+        """
+        packets = []
 
-        key = (header.packet_format, header.packet_version, header.packet_id)
+        for view in self.receive():
+            try:
+                packets.append(_unpack(view, PACKET_UNPACK_FROM_BY_ID))
+            except (KeyError, ValueError):
+                continue
 
-        return HEADER_FIELD_TO_PACKET_TYPE[key].unpack(packet)
+        return packets
@@ -4,11 +4,22 @@ https://forums.codemasters.com/topic/
 80231-f1-2021-udp-specification/?do=findComment&comment=624274
 """
 
+import collections
 import ctypes
+import dataclasses
+import functools
 import json
+import math
+import struct
+import typing
 
 import logging
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
@@ -21,7 +32,8 @@ logger = logging.getLogger(__name__)
 def to_json(*args, **kwargs):
     kwargs.setdefault("indent", 2)
 
-    kwargs["sort_keys"] = True
+    # Keys keep their _fields_ order, which is already deterministic, pass sort_keys=True to sort them anyway.
+    kwargs.setdefault("sort_keys", False)
     kwargs["ensure_ascii"] = False
     kwargs["separators"] = (",", ": ")
 
@@ -31,9 +43,38 @@ def to_json(*args, **kwargs):
 class PacketMixin(object):
     """A base set of helper methods for ctypes based packets"""
 
+    # Packets keep their data in the ctypes buffer, subclasses declare empty __slots__ so instances get no __dict__.
+    __slots__ = ()
+
+    # Filled in for each subclass declaring _fields_ by __init_subclass__.
+    _FIELD_NAMES: tuple = ()
+    _SIZE = 0
+
+    # Names of uint8 array fields holding ASCII codes, these are formatted as a ``str`` rather than a list of ints.
+    _ascii_fields_: frozenset = frozenset()
+
+    # (count_field, array_field) pairs where only the first count entries of the array are in use, the rest are left
+    # out of to_dict rather than formatted.
+    _variable_length_: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        fields = cls.__dict__.get("_fields_")
+
+        if fields is None:
+            return
+
+        cls._FIELD_NAMES = tuple(name for name, _ in fields)
+
+        # ctypes only lays the class out after this hook returns, so the size is worked out from the field types. All
+        # packets are packed, which makes it the sum of the fields, or the largest field for a union.
+        field_sizes = [ctypes.sizeof(field_type) for _, field_type in fields]
+        cls._SIZE = max(field_sizes) if issubclass(cls, ctypes.Union) else sum(field_sizes)
+
     def get_value(self, field):
-        """Returns the field's value and formats the types value"""
-        return self._format_type(getattr(self, field))
+        """Returns the field's value formatted as it is in ``to_dict``"""
+        return _field_parser(type(self), field)(self)
 
     def pack(self):
         """Packs the current data structure into a compressed binary
@@ -45,9 +86,28 @@ class PacketMixin(object):
         """
         return bytes(self)
 
+    def pack_into(self, buffer, offset=0):
+        """Packs the current data structure into a writable buffer, without creating an intermediate ``bytes``
+
+        Args:
+            buffer (bytearray):
+                - The buffer to write into
+            offset (int):
+                - Byte offset to write the packet at
+
+        """
+        memoryview(buffer)[offset : offset + self._SIZE] = self.as_memoryview()
+
+    def as_memoryview(self):
+        """Returns a byte ``memoryview`` of the packet's memory, e.g. for ``socket.sendto`` without copying
+
+        The view shares memory with the packet, so it reflects later changes to it.
+        """
+        return memoryview(self).cast("B")
+
     @classmethod
     def size(cls):
-        return ctypes.sizeof(cls)
+        return cls._SIZE
 
     @classmethod
     def unpack(cls, buffer):
@@ -60,54 +120,541 @@ class PacketMixin(object):
         """
         return cls.from_buffer_copy(buffer)
 
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        """Unpacks the binary structure without copying it when the buffer is writable
+
+        The returned packet shares memory with ``buffer``, so it changes when the buffer is written to. Call
+        ``to_dict`` or copy it before reusing the buffer. Read only buffers such as ``bytes`` are copied.
+
+        Args:
+            buffer (bytearray):
+                - The encoded buffer to decode
+            offset (int):
+                - Byte offset of the packet in the buffer
+
+        """
+        try:
+            return cls.from_buffer(buffer, offset)
+        except TypeError:
+            return cls.from_buffer_copy(buffer, offset)
+
+    @classmethod
+    def struct_format(cls):
+        """Returns the little endian ``struct`` format string matching the packet's wire layout"""
+        return "<" + _struct_codes(cls)
+
+    @classmethod
+    def unpack_values(cls, buffer, offset=0):
+        """Unpacks the binary structure into a flat ``tuple`` of field values, in _fields_ order
+
+        Nested packets and arrays are flattened in place, ``char`` arrays are returned as ``bytes``.
+
+        Args:
+            buffer (bytes):
+                - The encoded buffer to decode
+            offset (int):
+                - Byte offset of the packet in the buffer
+
+        """
+        return _packet_struct(cls).unpack_from(buffer, offset)
+
+    @classmethod
+    def unpack_rows(cls, buffer, field, offset=0):
+        """Unpacks an array field, such as the data for all 22 cars, into one flat ``tuple`` of values per entry
+
+        The whole packet is read with one ``struct`` call and the flat values are sliced into rows, nested packets in an
+        entry are flattened as in ``unpack_values``. For ``_variable_length_`` arrays only the counted entries are read.
+
+        Args:
+            buffer (bytes):
+                - The encoded buffer to decode
+            field (str):
+                - Name of an array field in the packet's _fields_
+            offset (int):
+                - Byte offset of the packet in the buffer
+
+        """
+        for count_field, array_field in cls._variable_length_:
+            if field == array_field:
+                return _counted_rows(cls, field, count_field, buffer, offset)
+
+        start, stop, step = _value_slices(cls)[field]
+        values = iter(_packet_struct(cls).unpack_from(buffer, offset)[start:stop])
+
+        return list(zip(*[values] * step))
+
+    @classmethod
+    def unpack_dict(cls, buffer, offset=0):
+        """Unpacks the binary structure straight into the ``dict`` ``to_dict`` would return, skipping ctypes
+
+        Args:
+            buffer (bytes):
+                - The encoded buffer to decode
+            offset (int):
+                - Byte offset of the packet in the buffer
+
+        """
+        return _parser(cls)(buffer, offset)
+
+    @classmethod
+    def unpack_record(cls, buffer, offset=0, record=None):
+        """Unpacks the binary structure straight into the record ``to_record`` would return, skipping ctypes
+
+        Args:
+            buffer (bytes):
+                - The encoded buffer to decode
+            offset (int):
+                - Byte offset of the packet in the buffer
+            record (callable):
+                - Returns the record class to build for a packet type, defaults to ``record_type``. The class is
+                  called with the field values in _fields_ order.
+
+        """
+        return _parser(cls, record or record_type)(buffer, offset)
+
     def to_dict(self):
         """Returns a ``dict`` with key-values derived from _fields_"""
-        return {k: self.get_value(k) for k, _ in self._fields_}
+        return _parser(type(self))(self)
+
+    def to_record(self):
+        """Returns a ``namedtuple`` of the values ``to_dict`` would return, nested packets are records too and arrays of
+        numbers are tuples
+
+        Records are smaller than dicts and cheaper to build, call ``_asdict()`` on one where a ``dict`` is needed.
+        """
+        return _parser(type(self), record_type)(self)
+
+    def to_aligned_numpy(self):
+        """Returns a copy of the packet as a numpy structured array with aligned fields, requires numpy
+
+        See ``f1_23_telemetry.arrays.to_aligned``.
+        """
+        from f1_23_telemetry import arrays
+
+        return arrays.to_aligned(self)
+
+    def car_array(self):
+        """Returns the entries for all 22 cars as a numpy structured array viewing the packet, requires numpy
+
+        Writes to the array change the packet. See ``f1_23_telemetry.arrays.car_array``.
+        """
+        from f1_23_telemetry import arrays
+
+        return arrays.car_array(type(self), self)
 
     def to_json(self):
-        """Returns a ``str`` of sorted JSON derived from _fields_"""
-        return to_json(self.to_dict())
+        """Returns a ``str`` of JSON derived from _fields_, keys are in _fields_ order
+
+        orjson produces the same two space indented layout in C, it is used when installed. It writes NaN and infinity
+        as ``null`` rather than ``NaN`` and ``Infinity``, so packets holding one go through ``json`` instead. Floats
+        with an exponent are spelled as orjson writes them, ``4.9e27`` rather than ``4.9e+27``.
+        """
+        values = self.unpack_values(self)
+        packet = _dict_builder(type(self))(values)
+
+        if orjson is not None and _finite(values):
+            return orjson.dumps(packet, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+        return to_json(packet)
+
+
+def _round3(value, _floor=math.floor):
+    """Returns ``round(value, 3)``, scaling and flooring in float arithmetic for the common case
+
+    ``round`` goes through a correctly rounded decimal conversion, which is slower than the packet floats need. Values
+    landing exactly on or beyond a half, and values too large to scale exactly, fall back to ``round`` so the result is
+    always identical to it, including the sign of values rounding to zero.
+    """
+    if -1e9 < value < 1e9:
+        scaled = value * 1000.0
+        rounded = _floor(scaled + 0.5)
+
+        if -0.5 < rounded - scaled < 0.5:
+            return rounded / 1000.0 if rounded else value * 0.0
+
+    return round(value, 3)
+
+
+def _finite(values):
+    """Whether every float in ``values`` is finite, a sum of them that overflows is treated as not finite too"""
+    return math.isfinite(sum(value for value in values if value.__class__ is float))
+
+
+def _decode_ascii(value):
+    """Decodes a uint8 array or ``bytes`` slice of an ASCII code in one go, trailing null bytes are dropped"""
+    return bytes(value).rstrip(b"\0").decode("ascii")
+
+
+def _fields(packet_type):
+    """Returns the ``(name, type)`` pairs of a packet's _fields_, typeshed types them too loosely for mypy"""
+    return typing.cast(typing.List[typing.Tuple[str, typing.Any]], packet_type._fields_)
+
 
-    def _format_type(self, value):
-        """A type helper to format values"""
-        class_name = type(value).__name__
+def _struct_codes(ctype):
+    """Returns the ``struct`` format codes for a ctypes type, without a byte order prefix"""
+    if issubclass(ctype, ctypes.Array):
+        if ctype._type_ is ctypes.c_char:
+            return f"{ctype._length_}s"
 
-        if class_name == "float":
-            return round(value, 3)
+        element_codes = _struct_codes(ctype._type_)
 
-        if class_name == "bytes":
-            return value.decode()
+        if len(element_codes) == 1:
+            return f"{ctype._length_}{element_codes}"
 
-        if isinstance(value, ctypes.Array):
-            return _format_array_type(value)
+        return element_codes * ctype._length_
 
-        if hasattr(value, "to_dict"):
-            return value.to_dict()
+    if issubclass(ctype, ctypes.Union):
+        # Unions can't be described field by field, leave them as raw bytes.
+        return f"{ctypes.sizeof(ctype)}s"
+
+    if issubclass(ctype, ctypes.Structure):
+        return "".join(_struct_codes(field_type) for _, field_type in ctype._fields_)
+
+    code = ctype._type_
+
+    if code in "fdc?":
+        return code
+
+    # Map integers by size, native codes such as "l" change width between platforms.
+    signed_code = {1: "b", 2: "h", 4: "i", 8: "q"}[ctypes.sizeof(ctype)]
+
+    return signed_code.upper() if code.isupper() else signed_code
+
+
+@functools.lru_cache(maxsize=None)
+def _packet_struct(packet_type):
+    """Returns the compiled ``struct.Struct`` for a packet type, built once per type"""
+    packet_struct = struct.Struct(packet_type.struct_format())
+
+    if packet_struct.size != ctypes.sizeof(packet_type):
+        raise ValueError(f"{packet_type.__name__} struct layout does not match its ctypes layout")
+
+    return packet_struct
+
+
+def _value_count(ctype):
+    """Returns how many values a ctypes type takes up in the flat tuple from ``unpack_values``"""
+    if issubclass(ctype, ctypes.Array):
+        if ctype._type_ is ctypes.c_char:
+            return 1
+
+        return _value_count(ctype._type_) * ctype._length_
+
+    if issubclass(ctype, ctypes.Structure):
+        return sum(_value_count(field_type) for _, field_type in ctype._fields_)
+
+    return 1
+
+
+@functools.lru_cache(maxsize=None)
+def _value_slices(packet_type):
+    """Returns ``{name: (start, stop, step)}`` locating each field in the flat tuple from ``unpack_values``
+
+    ``step`` is how many values each entry of an array field takes up, or the field's whole count otherwise.
+    """
+    slices = {}
+    start = 0
 
-        return value
+    for name, ctype in packet_type._fields_:
+        count = _value_count(ctype)
+        step = count
 
+        if issubclass(ctype, ctypes.Array) and ctype._type_ is not ctypes.c_char:
+            step = _value_count(ctype._type_)
 
-def _format_array_type(value):
-    results = []
+        slices[name] = (start, start + count, step)
+        start += count
 
-    for item in value:
-        if isinstance(item, Packet):
-            results.append(item.to_dict())
+    return slices
+
+
+def _is_float(ctype):
+    return ctype in (ctypes.c_float, ctypes.c_double)
+
+
+def _decode_chars(value):
+    """Matches ctypes ``char`` array behaviour, the value ends at the first null byte"""
+    return value.partition(b"\0")[0].decode()
+
+
+@functools.lru_cache(maxsize=None)
+def _fields_struct(packet_type, names):
+    """Returns a ``struct.Struct`` reading just the fields in ``names`` of a packet, skipping the bytes of the rest"""
+    codes = []
+    skipped = 0
+
+    for name, ctype in packet_type._fields_:
+        if name in names:
+            codes += [f"{skipped}x", _struct_codes(ctype)]
+            skipped = 0
         else:
-            results.append(item)
+            skipped += ctypes.sizeof(ctype)
+
+    return struct.Struct("<" + "".join(codes))
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_field_struct(packet_type, array_field, field):
+    """Returns a ``struct.Struct`` reading just ``field`` of every entry of an array of packets, skipping the rest"""
+    array_type = dict(packet_type._fields_)[array_field]
+    entry_type = array_type._type_
+    field_offset = getattr(entry_type, field).offset
+    field_codes = _struct_codes(dict(entry_type._fields_)[field])
+    field_size = getattr(entry_type, field).size
+
+    codes = [f"{getattr(packet_type, array_field).offset + field_offset}x", field_codes]
+    codes += [f"{entry_type._SIZE - field_size}x", field_codes] * (array_type._length_ - 1)
+
+    return struct.Struct("<" + "".join(codes))
+
+
+def _counted_rows(packet_type, array_field, count_field, buffer, offset):
+    """Unpacks the first entries of an array field, as many as its count field holds, skipping the unused entries"""
+    array_type = dict(packet_type._fields_)[array_field]
+    entry_struct = _packet_struct(array_type._type_)
+    count = min(buffer[offset + getattr(packet_type, count_field).offset], array_type._length_)
+    start = offset + getattr(packet_type, array_field).offset
+
+    return list(entry_struct.iter_unpack(memoryview(buffer)[start : start + count * entry_struct.size]))
+
+
+def _entry_names(packet, array_field, count):
+    """Decodes the ``name`` of the first ``count`` entries of an array of packets, reading them all in one go
+
+    Going through the ctypes array instead creates a Python object for every entry just to read its name.
+    """
+    names = _entry_field_struct(type(packet), array_field, "name").unpack_from(packet)
+
+    return [_decode_chars(name) for name in names[:count]]
+
+
+def _union_to_dict(union_type, raw, record=None):
+    members = [
+        _dict_builder(field_type, record)(field_type.unpack_values(raw)) for _, field_type in union_type._fields_
+    ]
+
+    if record:
+        return record(union_type)(*members)
+
+    return dict(zip(union_type._FIELD_NAMES, members))
+
+
+@functools.lru_cache(maxsize=None)
+def record_type(packet_type):
+    """Returns the ``namedtuple`` class ``to_record`` builds for a packet type, with the packet's field names
 
-    return results
+    Repeated field names are renamed to their position, as ``namedtuple`` does with ``rename=True``.
+    """
+    return collections.namedtuple(f"{packet_type.__name__}Record", packet_type._FIELD_NAMES, rename=True)
+
+
+@functools.lru_cache(maxsize=None)
+def dataclass_type(packet_type):
+    """Returns a frozen ``dataclass`` with ``__slots__`` for a packet type, with the same fields as its ``record_type``
+
+    Pass it as ``record`` to ``unpack_record`` for records with named attributes only, no ``__dict__`` and no tuple
+    behaviour. ``dataclass(slots=True)`` needs Python 3.10, so the slots are declared on the class instead.
+    """
+    names = record_type(packet_type)._fields
+
+    return dataclasses.make_dataclass(
+        f"{packet_type.__name__}Dataclass", names, namespace={"__slots__": names}, frozen=True
+    )
+
+
+def _field_expressions(packet_type, index, namespace, record, offset, names=None):
+    """Returns ``(name, expression)`` pairs building each field of ``packet_type`` from the flat values ``v``
+
+    ``index`` is where the packet's values start, each field reads a constant position ``v[{offset}N]``. Nested packets
+    and fixed arrays of packets are written out in place rather than calling another builder, only the counted entries
+    of ``_variable_length_`` arrays are built in a loop by an ``_entry_builder``.
+
+    ``names`` limits the pairs to those fields, ``v`` then only holds their values as read by ``_fields_struct``.
+    """
+    expressions = []
+    # Where each field's value sits, for looking up the count of a variable length array.
+    field_indexes = {}
+    count_fields = {array_field: count_field for count_field, array_field in packet_type._variable_length_}
+
+    for name, ctype in packet_type._fields_:
+        if names is not None and name not in names:
+            continue
+
+        value = f"v[{offset}{index}]"
+        count = _value_count(ctype)
+        field_indexes[name] = index
+
+        if name in packet_type._ascii_fields_:
+            expression = f"_decode_ascii(v[{offset}{index}:{offset}{index + count}])"
+        elif issubclass(ctype, ctypes.Union):
+            namespace[f"_t{index}"] = ctype
+            expression = f"_union_to_dict(_t{index}, {value}, _record_type)"
+        elif issubclass(ctype, ctypes.Structure):
+            expression = _container_expression(ctype, index, namespace, record, offset)
+        elif issubclass(ctype, ctypes.Array) and ctype._type_ is ctypes.c_char:
+            expression = f"_decode_chars({value})"
+        elif issubclass(ctype, ctypes.Array) and issubclass(ctype._type_, ctypes.Structure):
+            step = _value_count(ctype._type_)
+
+            if name in count_fields:
+                namespace[f"_b{index}"] = _entry_builder(ctype._type_, record)
+                length = f"min(v[{offset}{field_indexes[count_fields[name]]}], {ctype._length_})"
+                expression = f"[_b{index}(v, {offset}{index} + i * {step}) for i in range({length})]"
+            else:
+                entries = [
+                    _container_expression(ctype._type_, index + entry * step, namespace, record, offset)
+                    for entry in range(ctype._length_)
+                ]
+                expression = "[\n" + "".join(f"{entry},\n" for entry in entries) + "]"
+        elif issubclass(ctype, ctypes.Array) and record:
+            # Records are immutable, so arrays of numbers such as the four tyre temperatures stay as the tuple slice.
+            expression = f"v[{offset}{index}:{offset}{index + count}]"
+        elif issubclass(ctype, ctypes.Array):
+            expression = f"list(v[{offset}{index}:{offset}{index + count}])"
+        elif _is_float(ctype):
+            expression = f"_round3({value})"
+        else:
+            expression = value
+
+        expressions.append((name, expression))
+        index += count
+
+    return expressions
+
+
+def _container_expression(packet_type, index, namespace, record, offset):
+    """Returns the expression building the ``dict``, or ``record``, of a packet whose values start at ``index``"""
+    if issubclass(packet_type, ctypes.Union):
+        namespace[f"_t{index}"] = packet_type
+        return f"_union_to_dict(_t{index}, v[{offset}{index}], _record_type)"
+
+    expressions = _field_expressions(packet_type, index, namespace, record, offset)
+
+    if not record:
+        return "{\n" + "".join(f"{name!r}: {expression},\n" for name, expression in expressions) + "}"
+
+    record_name = f"_r_{packet_type.__name__}"
+    namespace[record_name] = record(packet_type)
+    values = "".join(f"{expression},\n" for _, expression in expressions)
+
+    if record is record_type:
+        # tuple.__new__ skips the Python level __new__ namedtuple generates, which checks the argument count.
+        return f"_new({record_name}, (\n{values}))"
+
+    return f"{record_name}(\n{values})"
+
+
+def _builder_namespace(record):
+    return {
+        "_decode_ascii": _decode_ascii,
+        "_decode_chars": _decode_chars,
+        "_new": tuple.__new__,
+        "_record_type": record,
+        "_round3": _round3,
+        "_union_to_dict": _union_to_dict,
+    }
+
+
+def _compile_function(packet_type, kind, arguments, body, namespace):
+    source = f"def build({arguments}):\n    {body}"
+    exec(compile(source, f"<{packet_type.__name__} {kind}>", "exec"), namespace)
+
+    return namespace["build"]
+
+
+def _compile_builder(packet_type, record, offset, kind, parse=False):
+    namespace = _builder_namespace(record)
+    expression = _container_expression(packet_type, 0, namespace, record, offset)
+
+    if parse:
+        namespace["_unpack_from"] = _packet_struct(packet_type).unpack_from
+        return _compile_function(
+            packet_type,
+            kind,
+            "buffer, offset=0",
+            f"v = _unpack_from(buffer, offset)\n    return {expression}",
+            namespace,
+        )
+
+    return _compile_function(packet_type, kind, "v, o" if offset else "v", f"return {expression}", namespace)
+
+
+@functools.lru_cache(maxsize=None)
+def _dict_builder(packet_type, record=None):
+    """Generates a function building the ``to_dict`` result of ``packet_type`` from its flat values
+
+    The function takes the flat tuple from ``unpack_values``. Every value, including those of nested packets and the
+    entries of their arrays, is read from a constant position by a straight line expression, so no per field type
+    checks, function calls or index arithmetic are left at runtime.
+
+    ``record`` swaps the ``dict`` for a record class, it is a function such as ``record_type`` returning the class for a
+    packet type. The record is built from the same values passed positionally, in _fields_ order.
+    """
+    return _compile_builder(packet_type, record, "", "record builder" if record else "dict builder")
+
+
+@functools.lru_cache(maxsize=None)
+def _field_parser(packet_type, field):
+    """Generates ``parse(buffer, offset=0)`` returning a single field of ``packet_type`` formatted as in ``to_dict``
+
+    Only the field is unpacked, along with its count for a ``_variable_length_`` array. It is built by the same
+    expression ``_parser`` uses for it, so ``get_value`` and ``to_dict`` always agree.
+    """
+    names = frozenset(
+        [field] + [count_field for count_field, array_field in packet_type._variable_length_ if array_field == field]
+    )
+    namespace = _builder_namespace(None)
+    expressions = dict(_field_expressions(packet_type, 0, namespace, None, "", names))
+    namespace["_unpack_from"] = _fields_struct(packet_type, names).unpack_from
+
+    return _compile_function(
+        packet_type,
+        f"{field} parser",
+        "buffer, offset=0",
+        f"v = _unpack_from(buffer, offset)\n    return {expressions[field]}",
+        namespace,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_builder(packet_type, record=None):
+    """Like ``_dict_builder`` but taking the index the packet's values start at too, for entries of counted arrays"""
+    return _compile_builder(packet_type, record, "o + ", "entry builder")
+
+
+@functools.lru_cache(maxsize=None)
+def _parser(packet_type, record=None):
+    """Generates ``parse(buffer, offset=0)``, unpacking an encoded ``packet_type`` straight into its ``to_dict`` result
+
+    The ``struct`` call and the ``_dict_builder`` expression are compiled into the one function, so decoding a packet
+    is a single Python call. A packet itself is a valid buffer, ``to_dict`` and ``to_record`` parse its memory.
+
+    This is built on first use rather than when the class is created, ctypes only lays the class out afterwards.
+    """
+    return _compile_builder(packet_type, record, "", "record parser" if record else "dict parser", parse=True)
 
 
 class Packet(ctypes.LittleEndianStructure, PacketMixin):
     """The base packet class for API version F1 22"""
 
+    __slots__ = ()
+
     _pack_ = 1
 
     def __repr__(self):
         return self.to_json()
 
 
+# Names for the array types repeated across packets. ctypes caches array types so these are the same objects an inline
+# ``ctypes.c_float * 4`` creates, the aliases just keep the per wheel fields consistent.
+U8x4 = ctypes.c_uint8 * 4
+U8x8 = ctypes.c_uint8 * 8
+U16x4 = ctypes.c_uint16 * 4
+F32x4 = ctypes.c_float * 4
+Char48 = ctypes.c_char * 48
+
+
 class PacketHeader(Packet):
     """
     struct PacketHeader
@@ -129,6 +676,8 @@ class PacketHeader(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("packet_format", ctypes.c_int16),  # 2023
         ("game_year", ctypes.c_uint8),  # Game year - last two digits e.g. 23
@@ -172,6 +721,8 @@ class CarMotionData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("world_position_x", ctypes.c_float),  # World space X position
         ("world_position_y", ctypes.c_float),  # World space Y position
@@ -203,6 +754,8 @@ class PacketMotionData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("car_motion_data", CarMotionData * 22),  # Data for all cars on track
@@ -218,6 +771,8 @@ class MarshalZone(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("zone_start", ctypes.c_float),  # Fraction (0..1) of way through the lap the marshal zone starts
         (
@@ -245,6 +800,8 @@ class WeatherForecastSample(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         # 0 = unknown, 1 = P1, 2 = P2, 3 = P3, 4 = Short P, 5 = Q1
         # 6 = Q2, 7 = Q3, 8 = Short Q, 9 = OSQ, 10 = R, 11 = R2
@@ -327,6 +884,13 @@ class PacketSessionData(Packet):
     };
     """
 
+    __slots__ = ()
+
+    _variable_length_ = (
+        ("num_marshal_zones", "marshal_zones"),
+        ("num_weather_forecast_samples", "weather_forecast_samples"),
+    )
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         # Weather - 0 = clear, 1 = light cloud, 2 = overcast
@@ -435,6 +999,8 @@ class LapData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("last_lap_time_in_ms", ctypes.c_uint32),  # Last lap time in milliseconds
         ("current_lap_time_in_ms", ctypes.c_uint32),  # Current time around the lap in milliseconds
@@ -486,6 +1052,8 @@ class PacketLapData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("lap_data", LapData * 22),  # Lap data for all cars on track
@@ -495,6 +1063,8 @@ class PacketLapData(Packet):
 
 
 class FastestLap(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("vehicle_idx", ctypes.c_uint8),  # Vehicle index of car achieving fastest lap
         ("lap_time", ctypes.c_float),  # Lap time is in seconds
@@ -502,24 +1072,32 @@ class FastestLap(Packet):
 
 
 class Retirement(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("vehicle_idx", ctypes.c_uint8),  # Vehicle index of car retiring
     ]
 
 
 class TeamMateInPits(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("vehicle_idx", ctypes.c_uint8),  # Vehicle index of team mate
     ]
 
 
 class RaceWinner(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("vehicle_idx", ctypes.c_uint8),  # Vehicle index of the race winner
     ]
 
 
 class Penalty(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("penalty_type", ctypes.c_uint8),  # Penalty type – see Appendices
         ("infringement_type", ctypes.c_uint8),  # Infringement type – see Appendices
@@ -538,6 +1116,8 @@ class Penalty(Packet):
 
 
 class SpeedTrap(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("vehicle_idx", ctypes.c_uint8),  # Vehicle index of the vehicle triggering speed trap
         ("speed", ctypes.c_float),  # Top speed achieved in kilometres per hour
@@ -550,24 +1130,32 @@ class SpeedTrap(Packet):
 
 
 class StartLights(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("num_lights", ctypes.c_uint8),  # Number of lights showing
     ]
 
 
 class DriveThroughPenaltyServed(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("vehicle_idx", ctypes.c_uint8),  # Vehicle index of the vehicle serving drive through
     ]
 
 
 class StopGoPenaltyServed(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("vehicle_idx", ctypes.c_uint8),  # Vehicle index of the vehicle serving stop go
     ]
 
 
 class Flashback(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("flashback_frame_identifier", ctypes.c_uint32),  # Frame identifier flashed back to
         ("flashback_session_time", ctypes.c_float),  # Session time flashed back to
@@ -575,6 +1163,8 @@ class Flashback(Packet):
 
 
 class Buttons(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("button_status", ctypes.c_uint32),  # Bit flags specifying which buttons are being pressed currently
         # - see appendices
@@ -582,6 +1172,8 @@ class Buttons(Packet):
 
 
 class OverTake(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("overtaking_vehicle_idx", ctypes.c_uint8),
         ("being_overtaken_vehicle_idx", ctypes.c_uint8),
@@ -589,6 +1181,8 @@ class OverTake(Packet):
 
 
 class EventDataDetails(ctypes.Union, PacketMixin):
+    __slots__ = ()
+
     _fields_ = [
         ("fastest_lap", FastestLap),
         ("retirement", Retirement),
@@ -629,9 +1223,13 @@ class PacketEventData(Packet):
     Overtake             "OVTK" Overtake occurred
     """
 
+    __slots__ = ()
+
+    _ascii_fields_ = frozenset({"event_string_code"})
+
     _fields_ = [
         ("header", PacketHeader),  # Header
-        ("event_string_code", ctypes.c_uint8 * 4),  # Event string code, see below
+        ("event_string_code", U8x4),  # Event string code, see below
         ("event_details", EventDataDetails),  # Event details - should be interpreted differently for each type
     ]
 
@@ -655,6 +1253,8 @@ class ParticipantData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("ai_controlled", ctypes.c_uint8),  # Whether the vehicle is AI (1) or Human (0) controlled
         ("driver_id", ctypes.c_uint8),  # Driver id - see appendix, 255 if network human
@@ -663,7 +1263,7 @@ class ParticipantData(Packet):
         ("my_team", ctypes.c_uint8),  # My team flag – 1 = My Team, 0 = otherwise
         ("race_number", ctypes.c_uint8),  # Race number of the car
         ("nationality", ctypes.c_uint8),  # Nationality of the driver
-        ("name", ctypes.c_char * 48),  # Name of participant in UTF-8 format – null terminated
+        ("name", Char48),  # Name of participant in UTF-8 format – null terminated
         # Will be truncated with … (U+2026) if too long
         ("your_telemetry", ctypes.c_uint8),  # The player's UDP setting, 0 = restricted, 1 = public
         ("show_online_names", ctypes.c_uint8),  # The player's show online names setting, 0 = off, 1 = on
@@ -681,12 +1281,20 @@ class PacketParticipantsData(Packet):
     };
     """
 
+    __slots__ = ()
+
+    _variable_length_ = (("num_active_cars", "participants"),)
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("num_active_cars", ctypes.c_uint8),  # Number of active cars in the data – should match number of cars on HUD
         ("participants", ParticipantData * 22),
     ]
 
+    def names(self):
+        """Returns the names of the active participants, decoded without creating a ``ParticipantData`` for each"""
+        return _entry_names(self, "participants", self.num_active_cars)
+
 
 class CarSetupData(Packet):
     """
@@ -717,6 +1325,8 @@ class CarSetupData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("front_wing", ctypes.c_uint8),  # Front wing aero
         ("rear_wing", ctypes.c_uint8),  # Rear wing aero
@@ -729,7 +1339,7 @@ class CarSetupData(Packet):
         ("front_suspension", ctypes.c_uint8),  # Front suspension
         ("rear_suspension", ctypes.c_uint8),  # Rear suspension
         ("front_anti_roll_bar", ctypes.c_uint8),  # Front anti-roll bar
-        ("rear_anti_roll_bar", ctypes.c_uint8),  # Front anti-roll bar
+        ("rear_anti_roll_bar", ctypes.c_uint8),  # Rear anti-roll bar
         ("front_suspension_height", ctypes.c_uint8),  # Front ride height
         ("rear_suspension_height", ctypes.c_uint8),  # Rear ride height
         ("brake_pressure", ctypes.c_uint8),  # Brake pressure (percentage)
@@ -752,12 +1362,38 @@ class PacketCarSetupData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("car_setups", CarSetupData * 22),
     ]
 
 
+# speed, throttle, steer, brake, clutch, gear, engine_rpm and drs in 10 bytes followed by the tyre pressures as halves.
+_compact_car_telemetry = struct.Struct("<HBbBBbHB4e")
+
+
+# Largest finite float16, the tyre pressures are clamped to it so they always fit the compact form.
+_FLOAT16_MAX = 65504.0
+
+
+def _quantise(value, scale, low, high):
+    """Scales and rounds ``value`` into ``low`` to ``high``, NaN becomes 0"""
+    if value != value:
+        return 0
+
+    return round(min(max(value * scale, low), high))
+
+
+def _float16(value):
+    """Clamps ``value`` into the float16 range, NaN becomes 0.0"""
+    if value != value:
+        return 0.0
+
+    return min(max(value, -_FLOAT16_MAX), _FLOAT16_MAX)
+
+
 class CarTelemetryData(Packet):
     """
     struct CarTelemetryData
@@ -781,6 +1417,8 @@ class CarTelemetryData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("speed", ctypes.c_uint16),  # Speed of car in kilometres per hour
         ("throttle", ctypes.c_float),  # Amount of throttle applied (0.0 to 1.0)
@@ -792,16 +1430,73 @@ class CarTelemetryData(Packet):
         ("drs", ctypes.c_uint8),  # 0 = off, 1 = on
         ("rev_lights_percent", ctypes.c_uint8),  # Rev lights indicator (percentage)
         ("rev_lights_bit_value", ctypes.c_uint16),  # Rev lights (bit 0 = leftmost LED, bit 14 = rightmost LED)
-        ("brakes_temperature", ctypes.c_uint16 * 4),  # Brakes temperature (celsius)
-        ("tyres_surface_temperature", ctypes.c_uint8 * 4),  # Tyres surface temperature (celsius)
-        ("tyres_inner_temperature", ctypes.c_uint8 * 4),  # Tyres inner temperature (celsius)
+        ("brakes_temperature", U16x4),  # Brakes temperature (celsius)
+        ("tyres_surface_temperature", U8x4),  # Tyres surface temperature (celsius)
+        ("tyres_inner_temperature", U8x4),  # Tyres inner temperature (celsius)
         ("engine_temperature", ctypes.c_uint16),  # Engine temperature (celsius)
-        ("tyres_pressure", ctypes.c_float * 4),  # Tyres pressure (PSI)
-        ("surface_type", ctypes.c_uint8 * 4),  # Driving surface, see appendices
+        ("tyres_pressure", F32x4),  # Tyres pressure (PSI)
+        ("surface_type", U8x4),  # Driving surface, see appendices
     ]
 
+    COMPACT_SIZE = _compact_car_telemetry.size
+
+    def to_compact(self):
+        """Returns the driver inputs and tyre pressures quantised into ``COMPACT_SIZE`` bytes, for rebroadcasting
+
+        Throttle and brake are scaled to 0 to 255, steer to -127 to 127 and the tyre pressures are stored as float16.
+        Values out of range are clamped into it and NaN becomes 0, as in ``arrays.compact_car_telemetry``.
+        """
+        return _compact_car_telemetry.pack(
+            self.speed,
+            _quantise(self.throttle, 255, 0, 255),
+            _quantise(self.steer, 127, -127, 127),
+            _quantise(self.brake, 255, 0, 255),
+            self.clutch,
+            self.gear,
+            self.engine_rpm,
+            self.drs,
+            *map(_float16, self.tyres_pressure),
+        )
+
+    @staticmethod
+    def from_compact(buffer, offset=0):
+        """Unpacks the output of ``to_compact`` into a ``dict``, the inputs are scaled back to their original range
+
+        Args:
+            buffer (bytes):
+                - The compact encoded buffer to decode
+            offset (int):
+                - Byte offset of the compact telemetry in the buffer
+
+        """
+        (
+            speed,
+            throttle,
+            steer,
+            brake,
+            clutch,
+            gear,
+            engine_rpm,
+            drs,
+            *tyres_pressure,
+        ) = _compact_car_telemetry.unpack_from(buffer, offset)
+
+        return {
+            "speed": speed,
+            "throttle": throttle / 255,
+            "steer": steer / 127,
+            "brake": brake / 255,
+            "clutch": clutch,
+            "gear": gear,
+            "engine_rpm": engine_rpm,
+            "drs": drs,
+            "tyres_pressure": tyres_pressure,
+        }
+
 
 class PacketCarTelemetryData(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("car_telemetry_data", CarTelemetryData * 22),
@@ -857,6 +1552,8 @@ class CarStatusData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("traction_control", ctypes.c_uint8),  # Traction control - 0 = off, 1 = medium, 2 = full
         ("anti_lock_brakes", ctypes.c_uint8),  # 0 (off) - 1 (on)
@@ -907,6 +1604,8 @@ class PacketCarStatusData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("car_status_data", CarStatusData * 22),
@@ -914,6 +1613,8 @@ class PacketCarStatusData(Packet):
 
 
 class FinalClassificationData(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("position", ctypes.c_uint8),  # Finishing position
         ("num_laps", ctypes.c_uint8),  # Number of laps completed
@@ -928,13 +1629,17 @@ class FinalClassificationData(Packet):
         ("penalties_time", ctypes.c_uint8),  # Total penalties accumulated in seconds
         ("num_penalties", ctypes.c_uint8),  # Number of penalties applied to this driver
         ("num_tyre_stints", ctypes.c_uint8),  # Number of tyres stints up to maximum
-        ("tyre_stints_actual", ctypes.c_uint8 * 8),  # Actual tyres used by this driver
-        ("tyre_stints_visual", ctypes.c_uint8 * 8),  # Visual tyres used by this driver
-        ("tyre_stints_end_laps", ctypes.c_uint8 * 8),  # The lap number stints end on
+        ("tyre_stints_actual", U8x8),  # Actual tyres used by this driver
+        ("tyre_stints_visual", U8x8),  # Visual tyres used by this driver
+        ("tyre_stints_end_laps", U8x8),  # The lap number stints end on
     ]
 
 
 class PacketFinalClassificationData(Packet):
+    __slots__ = ()
+
+    _variable_length_ = (("num_cars", "classification_data"),)
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("num_cars", ctypes.c_uint8),  # Number of cars in the final classification
@@ -943,12 +1648,14 @@ class PacketFinalClassificationData(Packet):
 
 
 class LobbyInfoData(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("ai_controlled", ctypes.c_uint8),  # Whether the vehicle is AI (1) or Human (0) controlled
         ("team_id", ctypes.c_uint8),  # Team id - see appendix (255 if no team currently selected)
         ("nationality", ctypes.c_uint8),  # Nationality of the driver
         ("platform", ctypes.c_uint8),  # 1 = Steam, 3 = PlayStation, 4 = Xbox, 6 = Origin, 255 = unknown
-        ("name", ctypes.c_char * 48),  # Name of participant in UTF-8 format – null terminated
+        ("name", Char48),  # Name of participant in UTF-8 format – null terminated
         # Will be truncated with ... (U+2026) if too long
         ("car_number", ctypes.c_uint8),  # Car number of the player
         ("ready_status", ctypes.c_uint8),  # 0 = not ready, 1 = ready, 2 = spectating
@@ -956,6 +1663,10 @@ class LobbyInfoData(Packet):
 
 
 class PacketLobbyInfoData(Packet):
+    __slots__ = ()
+
+    _variable_length_ = (("num_players", "lobby_players"),)
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         # Packet specific data
@@ -963,6 +1674,10 @@ class PacketLobbyInfoData(Packet):
         ("lobby_players", LobbyInfoData * 22),
     ]
 
+    def names(self):
+        """Returns the names of the players in the lobby, decoded without creating a ``LobbyInfoData`` for each"""
+        return _entry_names(self, "lobby_players", self.num_players)
+
 
 class CarDamageData(Packet):
     """
@@ -997,10 +1712,12 @@ class CarDamageData(Packet):
     }
     """
 
+    __slots__ = ()
+
     _fields_ = [
-        ("tyres_wear", ctypes.c_float * 4),  # Tyre wear (percentage)
-        ("tyres_damage", ctypes.c_uint8 * 4),  # Tyre damage (percentage)
-        ("brakes_damage", ctypes.c_uint8 * 4),  # Brakes damage (percentage)
+        ("tyres_wear", F32x4),  # Tyre wear (percentage)
+        ("tyres_damage", U8x4),  # Tyre damage (percentage)
+        ("brakes_damage", U8x4),  # Brakes damage (percentage)
         ("front_left_wing_damage", ctypes.c_uint8),  # Front left wing damage (percentage)
         ("front_right_wing_damage", ctypes.c_uint8),  # Front right wing damage (percentage)
         ("rear_wing_damage", ctypes.c_uint8),  # Rear wing damage (percentage)
@@ -1023,6 +1740,8 @@ class CarDamageData(Packet):
 
 
 class PacketCarDamageData(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("car_damage_data", CarDamageData * 22),
@@ -1054,6 +1773,8 @@ class LapHistoryData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("lap_time_in_ms", ctypes.c_uint32),  # Lap time in milliseconds
         ("sector1_time_in_ms", ctypes.c_uint16),  # Sector 1 time in milliseconds
@@ -1061,13 +1782,15 @@ class LapHistoryData(Packet):
         ("sector2_time_in_ms", ctypes.c_uint16),  # Sector 2 time in milliseconds
         ("sector2_time_minutes", ctypes.c_uint8),  # Sector 2 whole minute part
         ("sector3_time_in_ms", ctypes.c_uint16),  # Sector 3 time in milliseconds
-        ("sector1_time_minutes", ctypes.c_uint8),  # Sector 3 whole minute part
+        ("sector3_time_minutes", ctypes.c_uint8),  # Sector 3 whole minute part
         ("lap_valid_bit_flags", ctypes.c_uint8),  # 0x01 bit set-lap valid, 0x02 bit set-sector 1 valid
         # 0x04 bit set-sector 2 valid, 0x08 bit set-sector 3 valid
     ]
 
 
 class TyreStintHistoryData(Packet):
+    __slots__ = ()
+
     _fields_ = [
         # Lap the tyre usage ends on (255 of current tyre)
         ("end_lap", ctypes.c_uint8),
@@ -1077,6 +1800,13 @@ class TyreStintHistoryData(Packet):
 
 
 class PacketSessionHistoryData(Packet):
+    __slots__ = ()
+
+    _variable_length_ = (
+        ("num_laps", "lap_history_data"),
+        ("num_tyre_stints", "tyre_stints_history_data"),
+    )
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("car_idx", ctypes.c_uint8),  # Index of the car this lap data relates to
@@ -1112,6 +1842,8 @@ class TyreSetData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("actual_tyre_compound", ctypes.c_uint8),  # Actual tyre compound used
         ("visual_tyre_compound", ctypes.c_uint8),  # Visual tyre compound used
@@ -1126,6 +1858,8 @@ class TyreSetData(Packet):
 
 
 class PacketTyreSetsData(Packet):
+    __slots__ = ()
+
     _fields_ = [
         ("header", PacketHeader),  # Header
         ("car_idx", ctypes.c_uint8),  # Index of the car this data relates to
@@ -1170,16 +1904,18 @@ class PacketMotionExData(Packet):
     };
     """
 
+    __slots__ = ()
+
     _fields_ = [
         ("header", PacketHeader),  # Header
-        ("m_suspensionPosition", ctypes.c_float * 4),  # Note: All wheel arrays have the following order:
-        ("m_suspensionVelocity", ctypes.c_float * 4),  # RL, RR, FL, FR
-        ("m_suspensionAcceleration", ctypes.c_float * 4),  # RL, RR, FL, FR
-        ("m_wheelSpeed", ctypes.c_float * 4),  # Speed of each wheel
-        ("m_wheelSlipRatio", ctypes.c_float * 4),  # Slip ratio for each wheel
-        ("m_wheelSlipAngle", ctypes.c_float * 4),  # Slip angles for each wheel
-        ("m_wheelLatForce", ctypes.c_float * 4),  # Lateral forces for each wheel
-        ("m_wheelLongForce", ctypes.c_float * 4),  # Longitudinal forces for each wheel
+        ("m_suspensionPosition", F32x4),  # Note: All wheel arrays have the following order:
+        ("m_suspensionVelocity", F32x4),  # RL, RR, FL, FR
+        ("m_suspensionAcceleration", F32x4),  # RL, RR, FL, FR
+        ("m_wheelSpeed", F32x4),  # Speed of each wheel
+        ("m_wheelSlipRatio", F32x4),  # Slip ratio for each wheel
+        ("m_wheelSlipAngle", F32x4),  # Slip angles for each wheel
+        ("m_wheelLatForce", F32x4),  # Lateral forces for each wheel
+        ("m_wheelLongForce", F32x4),  # Longitudinal forces for each wheel
         ("m_heightOfCOGAboveGround", ctypes.c_float),  # Height of centre of gravity above ground
         ("m_localVelocityX", ctypes.c_float),  # Velocity in local space – metres/s
         ("m_localVelocityY", ctypes.c_float),  # Velocity in local space
@@ -1191,7 +1927,7 @@ class PacketMotionExData(Packet):
         ("m_angularAccelerationY", ctypes.c_float),  # Angular acceleration y-component
         ("m_angularAccelerationZ", ctypes.c_float),  # Angular acceleration z-component
         ("m_frontWheelsAngle", ctypes.c_float),  # Current front wheels angle in radians
-        ("m_wheelVertForce", ctypes.c_float),  # Vertical forces for each wheel
+        ("m_wheelVertForce", F32x4),  # Vertical forces for each wheel
     ]
 
 
@@ -1211,3 +1947,113 @@ HEADER_FIELD_TO_PACKET_TYPE = {
     (2023, 1, 12): PacketTyreSetsData,
     (2023, 1, 13): PacketMotionExData,
 }
+
+PACKET_FORMAT = 2023
+
+# Every packet type of PACKET_FORMAT is at this version, so the version can be checked once rather than used as a key.
+PACKET_VERSION = 1
+
+# Packet types for PACKET_FORMAT indexed by packet_id alone, for callers that trust the packet version. Indexing a
+# tuple by the id byte costs the same for every packet type, testing the frequent motion, lap and telemetry ids first
+# in an if/elif chain is slower even for those.
+PACKET_BY_ID = (
+    PacketMotionData,  # 0
+    PacketSessionData,  # 1
+    PacketLapData,  # 2
+    PacketEventData,  # 3
+    PacketParticipantsData,  # 4
+    PacketCarSetupData,  # 5
+    PacketCarTelemetryData,  # 6
+    PacketCarStatusData,  # 7
+    PacketFinalClassificationData,  # 8
+    PacketLobbyInfoData,  # 9
+    PacketCarDamageData,  # 10
+    PacketSessionHistoryData,  # 11
+    PacketTyreSetsData,  # 12
+    PacketMotionExData,  # 13
+)
+
+# The bound unpack of each entry above, resolved once rather than looked up on the class per packet.
+PACKET_UNPACK_BY_ID = tuple(packet_type.unpack for packet_type in PACKET_BY_ID)
+PACKET_UNPACK_FROM_BY_ID = tuple(packet_type.unpack_from for packet_type in PACKET_BY_ID)
+
+# The field holding one entry per car, for each packet type that has one.
+CAR_ARRAY_FIELDS = {
+    packet_type: name
+    for packet_type in PACKET_BY_ID
+    for name, ctype in _fields(packet_type)
+    if issubclass(ctype, ctypes.Array) and issubclass(ctype._type_, ctypes.Structure) and ctype._length_ == 22
+}
+
+PACKET_ID_OFFSET = PacketHeader.packet_id.offset
+
+# The header as a compiled struct, for callers that need a few header fields without creating a PacketHeader.
+HEADER_STRUCT = _packet_struct(PacketHeader)
+
+# packet_format, packet_version and packet_id, skipping the game year and version bytes between them.
+HEADER_KEY_STRUCT = struct.Struct("<H3xBB")
+
+# Size of each packet in the F1 23 UDP specification, indexed by packet_id.
+PACKET_SIZE_BY_ID = (1349, 644, 1131, 45, 1306, 1107, 1352, 1239, 1020, 1218, 953, 1460, 231, 217)
+
+# Both the ctypes layout and the little endian, unpadded struct format of every packet must match the wire size, so a
+# mistyped field fails on import rather than misparsing.
+for _packet_type, _size in zip(PACKET_BY_ID, PACKET_SIZE_BY_ID):
+    if not ctypes.sizeof(_packet_type) == struct.calcsize(_packet_type.struct_format()) == _size:
+        raise TypeError(f"{_packet_type.__name__} does not match its {_size} byte wire layout")
+
+del _packet_type, _size
+
+
+def peek_packet_id(buffer):
+    """Returns the packet id of an encoded packet, read straight from its byte without unpacking the header"""
+    return buffer[PACKET_ID_OFFSET]
+
+
+def peek_packet_key(buffer, offset=0):
+    """Returns the ``(packet_format, packet_version, packet_id)`` key of HEADER_FIELD_TO_PACKET_TYPE for an encoded
+    packet, reading only those three fields of the header
+
+    Args:
+        buffer (bytes):
+            - The encoded buffer to read
+        offset (int):
+            - Byte offset of the packet in the buffer
+
+    """
+    return HEADER_KEY_STRUCT.unpack_from(buffer, offset)
+
+
+def unpack_header_values(buffer, offset=0):
+    """Unpacks just the header of an encoded packet into a flat ``tuple`` of values, in _fields_ order
+
+    Args:
+        buffer (bytes):
+            - The encoded buffer to decode
+        offset (int):
+            - Byte offset of the packet in the buffer
+
+    """
+    return HEADER_STRUCT.unpack_from(buffer, offset)
+
+
+def dispatch(buffer):
+    """Unpacks a packet of any type by reading just its packet id, without copying when the buffer is writable
+
+    Args:
+        buffer (bytearray):
+            - The encoded buffer to decode
+
+    """
+    return PACKET_BY_ID[peek_packet_id(buffer)].unpack_from(buffer)
+
+
+def dispatch_record(buffer):
+    """Unpacks a packet of any type by reading just its packet id, straight into a ``to_record`` record with ``struct``
+
+    Args:
+        buffer (bytes):
+            - The encoded buffer to decode
+
+    """
+    return _parser(PACKET_BY_ID[peek_packet_id(buffer)], record_type)(buffer)
@@ -0,0 +1,122 @@
+"""
+Optional msgspec structs for packets, for consumers holding on to a lot of decoded packets.
+
+The structs are built with ``gc=False`` and ``array_like=True``, they are smaller than ctypes packets or records and
+are never tracked by the garbage collector. Requires msgspec, install with ``pip install f1-23-telemetry[msgspec]``.
+"""
+
+import ctypes
+import functools
+import typing
+
+import msgspec
+
+from f1_23_telemetry.packets import PACKET_BY_ID, peek_packet_id, record_type
+
+
+@functools.lru_cache(maxsize=None)
+def struct_type(packet_type):
+    """Returns the ``msgspec.Struct`` class for a packet type, with the same fields as its ``record_type``
+
+    Nested packets are typed as their own structs and arrays of numbers as tuples so ``decoder`` rebuilds them, every
+    other field is left untyped.
+
+    Args:
+        packet_type (type):
+            - A ``Packet`` subclass
+
+    """
+    fields = [
+        (name, _field_type(packet_type, field, ctype))
+        for name, (field, ctype) in zip(record_type(packet_type)._fields, packet_type._fields_)
+    ]
+
+    return msgspec.defstruct(
+        f"{packet_type.__name__}Struct",
+        fields,
+        module=__name__,
+        gc=False,
+        array_like=True,
+    )
+
+
+def _field_type(packet_type, field, ctype):
+    if issubclass(ctype, ctypes.Structure):
+        return struct_type(ctype)
+
+    if issubclass(ctype, ctypes.Array) and issubclass(ctype._type_, ctypes.Structure):
+        return typing.List[struct_type(ctype._type_)]
+
+    if issubclass(ctype, ctypes.Array) and ctype._type_ is not ctypes.c_char:
+        # ASCII fields are decoded to a str.
+        return typing.Any if field in packet_type._ascii_fields_ else tuple
+
+    return typing.Any
+
+
+def unpack(packet_type, buffer, offset=0):
+    """Unpacks the binary structure straight into a ``struct_type`` struct, nested packets are structs too
+
+    Args:
+        packet_type (type):
+            - The ``Packet`` subclass laid out in the buffer
+        buffer (bytes):
+            - The encoded buffer to decode
+        offset (int):
+            - Byte offset of the packet in the buffer
+
+    """
+    return packet_type.unpack_record(buffer, offset, struct_type)
+
+
+def dispatch(buffer):
+    """Unpacks a packet of any type into a struct by reading just its packet id
+
+    Args:
+        buffer (bytes):
+            - The encoded buffer to decode
+
+    """
+    return unpack(PACKET_BY_ID[peek_packet_id(buffer)], buffer)
+
+
+# Encodes structs straight from their slots, each one as a msgpack array in field order.
+_encoder = msgspec.msgpack.Encoder()
+
+
+def encode(packet):
+    """Encodes a struct from ``unpack`` or ``dispatch`` as msgpack, for writing to disk or sending to another process
+
+    Args:
+        packet (msgspec.Struct):
+            - The struct to encode
+
+    """
+    return _encoder.encode(packet)
+
+
+@functools.lru_cache(maxsize=None)
+def decoder(packet_type):
+    """Returns a ``msgspec.msgpack.Decoder`` turning the output of ``encode`` back into a ``struct_type`` struct
+
+    Args:
+        packet_type (type):
+            - The ``Packet`` subclass that was encoded
+
+    """
+    return msgspec.msgpack.Decoder(struct_type(packet_type))
+
+
+def decode(packet_type, data):
+    """Decodes the output of ``encode`` back into a ``struct_type`` struct
+
+    Unions such as ``event_details`` have no single struct type, they are decoded as arrays of their values.
+
+    Args:
+        packet_type (type):
+            - The ``Packet`` subclass that was encoded
+        data (bytes):
+            - The msgpack encoded struct
+
+    """
+    return decoder(packet_type).decode(data)
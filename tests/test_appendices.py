@@ -0,0 +1,43 @@
+"""
+Checks the lookup tables and lists built from the appendices against the mappings they are built from.
+"""
+
+import pytest
+
+from f1_23_telemetry import appendices
+
+TABLES = [name for name in dir(appendices) if name.endswith("_TBL")]
+LISTS = [name for name in dir(appendices) if name.endswith("_LIST")]
+
+
+@pytest.mark.parametrize("name", TABLES)
+def test_table(name):
+    table = getattr(appendices, name)
+    mapping = getattr(appendices, name[: -len("_TBL")])
+
+    assert {key: appendices.lookup(table, key) for key in range(len(table))} == {
+        key: mapping.get(key) for key in range(len(table))
+    }
+    assert appendices.lookup(table, -1) is None
+    assert appendices.lookup(table, len(table)) is None
+
+
+@pytest.mark.parametrize("name", LISTS)
+def test_list(name):
+    labels = getattr(appendices, name)
+    mapping = getattr(appendices, name[: -len("_LIST")])
+
+    assert labels == [mapping.get(key, "") for key in range(max(mapping) + 1)]
+
+
+def test_driver_id_by_name():
+    first_ids = {}
+
+    for driver_id, name in appendices.DRIVER_IDS.items():
+        first_ids.setdefault(name, driver_id)
+
+    # Twice over, the second pass is answered from the cache.
+    for _ in range(2):
+        assert {name: appendices.driver_id_by_name(name) for name in first_ids} == first_ids
+
+    assert appendices.driver_id_by_name("Not A Driver") is None
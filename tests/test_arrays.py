@@ -0,0 +1,68 @@
+"""
+Checks the numpy views over the saved packets against their to_dict output.
+"""
+
+import json
+import pathlib
+
+import pytest
+
+from f1_23_telemetry import packets
+
+np = pytest.importorskip("numpy")
+arrays = pytest.importorskip("f1_23_telemetry.arrays")
+
+SAMPLES = json.loads((pathlib.Path(__file__).parent / "data" / "packets.json").read_text())
+
+
+def sample(packet_type):
+    data = SAMPLES[packet_type.__name__]
+
+    return bytes.fromhex(data["raw"]), data["dict"]
+
+
+def assert_matches(array, entries):
+    """Checks each field of a structured array against the same key of the ``to_dict`` entries"""
+    assert len(array) == len(entries)
+
+    for name in array.dtype.names:
+        values = [entry[name] for entry in entries]
+
+        if array.dtype[name].kind == "S":
+            assert [value.partition(b"\0")[0].decode() for value in array[name]] == values
+        else:
+            # to_dict rounds floats to 3 decimals.
+            np.testing.assert_allclose(array[name], values, rtol=1e-6, atol=1e-3, err_msg=name)
+
+
+@pytest.mark.parametrize("packet_type", packets.CAR_ARRAY_FIELDS, ids=lambda packet_type: packet_type.__name__)
+def test_car_array(packet_type):
+    raw, expected = sample(packet_type)
+
+    assert_matches(arrays.car_array(packet_type, raw), expected[packets.CAR_ARRAY_FIELDS[packet_type]])
+    assert_matches(arrays.car_array(packet_type, b"\0\0\0" + raw, 3), expected[packets.CAR_ARRAY_FIELDS[packet_type]])
+
+
+def test_lap_history_array():
+    raw, expected = sample(packets.PacketSessionHistoryData)
+    laps = arrays.lap_history_array(raw)
+
+    assert len(laps) == expected["num_laps"]
+    assert_matches(laps, expected["lap_history_data"])
+
+
+def test_compact_car_telemetry():
+    raw, _ = sample(packets.PacketCarTelemetryData)
+    packet = packets.PacketCarTelemetryData.unpack(raw)
+
+    # The saved sample already overflows float16 and the input ranges, add NaN and infinities too.
+    packet.car_telemetry_data[0].throttle = float("nan")
+    packet.car_telemetry_data[0].tyres_pressure[:] = [float("nan"), float("inf"), float("-inf"), -1e9]
+    packet.car_telemetry_data[1].steer = float("-inf")
+    packet.car_telemetry_data[1].brake = -2.5
+
+    compact = arrays.compact_car_telemetry(arrays.car_telemetry_array(packet))
+
+    assert compact.tobytes() == b"".join(car.to_compact() for car in packet.car_telemetry_data)
+    assert compact[0]["throttle"] == 0
+    assert compact[0]["tyres_pressure"].tolist() == [0.0, 65504.0, -65504.0, -65504.0]
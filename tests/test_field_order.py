@@ -0,0 +1,47 @@
+"""
+Snapshot of the key order of to_dict and to_json for every packet type.
+"""
+
+import json
+import pathlib
+
+import pytest
+
+from f1_23_telemetry import packets
+
+SAMPLES = json.loads((pathlib.Path(__file__).parent / "data" / "packets.json").read_text())
+
+
+def key_paths(value, prefix=""):
+    """Returns the key of every dict in ``value`` as a dotted path, in order, entries of lists are written as ``[]``"""
+    paths = []
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            paths.append(prefix + key)
+            paths.extend(key_paths(item, prefix + key + "."))
+    elif isinstance(value, list) and value:
+        paths.extend(key_paths(value[0], prefix[:-1] + "[]."))
+
+    return paths
+
+
+@pytest.mark.parametrize("packet_type", packets.PACKET_BY_ID, ids=lambda packet_type: packet_type.__name__)
+def test_to_dict_key_order(packet_type):
+    sample = SAMPLES[packet_type.__name__]
+    packet = packet_type.unpack(bytes.fromhex(sample["raw"]))
+
+    assert key_paths(packet.to_dict()) == key_paths(sample["dict"])
+
+
+@pytest.mark.parametrize("packet_type", packets.PACKET_BY_ID, ids=lambda packet_type: packet_type.__name__)
+def test_to_json_key_order(packet_type):
+    sample = SAMPLES[packet_type.__name__]
+    packet = packet_type.unpack(bytes.fromhex(sample["raw"]))
+
+    assert key_paths(json.loads(packet.to_json())) == key_paths(sample["dict"])
+
+
+def test_top_level_keys_follow_fields():
+    for packet_type in packets.PACKET_BY_ID:
+        assert list(packet_type().to_dict()) == [name for name, _ in packet_type._fields_]
@@ -0,0 +1,130 @@
+"""
+Sends the saved packets to the listeners over a loopback socket and checks what they receive.
+"""
+
+import asyncio
+import json
+import pathlib
+import socket
+
+import pytest
+
+from f1_23_telemetry import packets
+from f1_23_telemetry.listener import BatchedReceiver, TelemetryListener
+
+SAMPLES = json.loads((pathlib.Path(__file__).parent / "data" / "packets.json").read_text())
+
+RAW = {packet_type: bytes.fromhex(SAMPLES[packet_type.__name__]["raw"]) for packet_type in packets.PACKET_BY_ID}
+
+# Datagrams that are not a packet, a stray byte and a header of an unknown format.
+JUNK = (b"\x01", b"\xff" * 30)
+
+
+@pytest.fixture
+def listener():
+    listener = TelemetryListener(host="127.0.0.1", port=0)
+    listener.socket.settimeout(2.0)
+
+    yield listener
+
+    listener.socket.close()
+
+
+def send(listener, *datagrams):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+        for datagram in datagrams:
+            sender.sendto(datagram, listener.socket.getsockname())
+
+
+def expected(packet_type):
+    return SAMPLES[packet_type.__name__]["dict"]
+
+
+def test_get(listener):
+    send(listener, RAW[packets.PacketLapData], RAW[packets.PacketMotionData])
+
+    assert listener.get().to_dict() == expected(packets.PacketLapData)
+    assert listener.get(copy=False).to_dict() == expected(packets.PacketMotionData)
+
+
+def test_header(listener):
+    send(listener, RAW[packets.PacketLapData], RAW[packets.PacketEventData])
+
+    listener.get()
+    assert listener.header.to_dict() == expected(packets.PacketLapData)["header"]
+
+    listener.get()
+    assert listener.header.to_dict() == expected(packets.PacketEventData)["header"]
+
+
+def test_get_batch_skips_junk(listener):
+    datagrams = list(RAW.values())
+    send(listener, *datagrams[:5], *JUNK, *datagrams[5:])
+
+    batch = listener.get_batch(max_packets=64)
+
+    assert [packet.to_dict() for packet in batch] == [expected(packet_type) for packet_type in RAW]
+    assert listener.socket.gettimeout() == 2.0
+
+
+def test_get_batch_keeps_the_rest_queued(listener):
+    send(listener, *RAW.values())
+
+    batches = [listener.get_batch(max_packets=5) for _ in range(3)]
+
+    assert [len(batch) for batch in batches] == [5, 5, 4]
+    assert [type(packet) for batch in batches for packet in batch] == list(RAW)
+
+
+def test_get_cars(listener):
+    send(listener, RAW[packets.PacketCarTelemetryData], RAW[packets.PacketEventData])
+
+    packet, cars = listener.get_cars()
+    assert packet.to_dict() == expected(packets.PacketCarTelemetryData)
+    assert [car.to_dict() for car in cars] == expected(packets.PacketCarTelemetryData)["car_telemetry_data"]
+
+    packet, cars = listener.get_cars()
+    assert packet.to_dict() == expected(packets.PacketEventData)
+    assert cars == ()
+
+
+def test_iter_packets_skips_junk(listener):
+    datagrams = list(RAW.values())
+
+    async def receive(count):
+        received = []
+
+        async for packet in listener.iter_packets():
+            received.append(packet.to_dict())
+
+            if len(received) == count:
+                return received
+
+    send(listener, *datagrams[:5], *JUNK, *datagrams[5:])
+
+    assert asyncio.run(receive(len(datagrams))) == [expected(packet_type) for packet_type in RAW]
+    assert listener.socket.gettimeout() == 2.0
+
+
+def test_iter_packets_waits_for_packets(listener):
+    async def receive():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, send, listener, JUNK[1], RAW[packets.PacketLapData])
+
+        async for packet in listener.iter_packets():
+            return packet.to_dict()
+
+    assert asyncio.run(receive()) == expected(packets.PacketLapData)
+
+
+def test_batched_receiver_skips_junk(listener):
+    receiver = BatchedReceiver(listener.socket)
+    send(listener, RAW[packets.PacketLapData], *JUNK, RAW[packets.PacketMotionData])
+
+    batch = receiver.get()
+
+    assert [packet.to_dict() for packet in batch] == [
+        expected(packets.PacketLapData),
+        expected(packets.PacketMotionData),
+    ]
+    assert listener.socket.gettimeout() == 2.0
@@ -0,0 +1,42 @@
+"""
+Round trips the saved packets through the msgspec structs.
+"""
+
+import json
+import pathlib
+
+import pytest
+
+from f1_23_telemetry import packets
+
+structs = pytest.importorskip("f1_23_telemetry.structs")
+
+SAMPLES = json.loads((pathlib.Path(__file__).parent / "data" / "packets.json").read_text())
+
+
+def sample(packet_type):
+    return bytes.fromhex(SAMPLES[packet_type.__name__]["raw"])
+
+
+@pytest.mark.parametrize("packet_type", packets.PACKET_BY_ID, ids=lambda packet_type: packet_type.__name__)
+def test_unpack(packet_type):
+    raw = sample(packet_type)
+    packet = structs.unpack(packet_type, raw)
+
+    assert type(packet) is structs.struct_type(packet_type)
+    assert structs.dispatch(raw) == packet
+    assert packet.__struct_fields__ == packets.record_type(packet_type)._fields
+
+
+@pytest.mark.parametrize("packet_type", packets.PACKET_BY_ID, ids=lambda packet_type: packet_type.__name__)
+def test_encode_decode(packet_type):
+    packet = structs.unpack(packet_type, sample(packet_type))
+    data = structs.encode(packet)
+    decoded = structs.decode(packet_type, data)
+
+    assert type(decoded) is structs.struct_type(packet_type)
+    assert structs.encode(decoded) == data
+
+    # Unions such as event_details come back as arrays of their values, every other packet decodes to an equal struct.
+    if packet_type is not packets.PacketEventData:
+        assert decoded == packet
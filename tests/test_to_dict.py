@@ -0,0 +1,102 @@
+"""
+Checks the generated to_dict, unpack_dict and to_record parsers against the to_dict output saved for each packet type.
+"""
+
+import json
+import pathlib
+
+import pytest
+
+from f1_23_telemetry import packets
+
+SAMPLES = json.loads((pathlib.Path(__file__).parent / "data" / "packets.json").read_text())
+
+
+def as_plain(value):
+    """Returns a record as the ``dict`` ``to_dict`` builds, with tuples as lists"""
+    if hasattr(value, "_asdict"):
+        return {key: as_plain(item) for key, item in value._asdict().items()}
+
+    if isinstance(value, (list, tuple)):
+        return [as_plain(item) for item in value]
+
+    return value
+
+
+def sample(packet_type):
+    data = SAMPLES[packet_type.__name__]
+
+    return bytes.fromhex(data["raw"]), data["dict"]
+
+
+@pytest.mark.parametrize("packet_type", packets.PACKET_BY_ID, ids=lambda packet_type: packet_type.__name__)
+def test_to_dict(packet_type):
+    raw, expected = sample(packet_type)
+
+    assert packet_type.unpack(raw).to_dict() == expected
+
+
+@pytest.mark.parametrize("packet_type", packets.PACKET_BY_ID, ids=lambda packet_type: packet_type.__name__)
+def test_unpack_dict(packet_type):
+    raw, expected = sample(packet_type)
+
+    assert packet_type.unpack_dict(raw) == expected
+    assert packet_type.unpack_dict(b"\0\0\0" + raw, 3) == expected
+
+
+@pytest.mark.parametrize("packet_type", packets.PACKET_BY_ID, ids=lambda packet_type: packet_type.__name__)
+def test_to_record(packet_type):
+    raw, expected = sample(packet_type)
+
+    assert as_plain(packet_type.unpack(raw).to_record()) == expected
+    assert as_plain(packets.dispatch_record(raw)) == expected
+
+
+@pytest.mark.parametrize("packet_type", packets.PACKET_BY_ID, ids=lambda packet_type: packet_type.__name__)
+def test_get_value(packet_type):
+    raw, expected = sample(packet_type)
+    packet = packet_type.unpack(raw)
+
+    assert {name: packet.get_value(name) for name in packet_type._FIELD_NAMES} == expected
+
+
+VARIABLE_LENGTH = [
+    (packet_type, count_field, array_field)
+    for packet_type in packets.PACKET_BY_ID
+    for count_field, array_field in packet_type._variable_length_
+]
+
+
+def counted_sample(packet_type, count_field, count):
+    """Returns the saved sample with ``count_field`` set to ``count``, along with a copy of its expected ``dict``"""
+    raw, expected = sample(packet_type)
+    raw = bytearray(raw)
+    raw[getattr(packet_type, count_field).offset] = count
+
+    return bytes(raw), dict(expected, **{count_field: count})
+
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+@pytest.mark.parametrize(
+    "packet_type, count_field, array_field",
+    VARIABLE_LENGTH,
+    ids=lambda value: value.__name__ if isinstance(value, type) else value,
+)
+def test_variable_length(packet_type, count_field, array_field, count):
+    raw, expected = counted_sample(packet_type, count_field, count)
+    expected[array_field] = expected[array_field][:count]
+    packet = packet_type.unpack(raw)
+
+    assert packet.to_dict() == expected
+    assert packet_type.unpack_dict(raw) == expected
+    assert as_plain(packet.to_record()) == expected
+    assert packet.get_value(array_field) == expected[array_field]
+
+    full_raw, _ = counted_sample(packet_type, count_field, dict(packet_type._fields_)[array_field]._length_)
+    rows = packet_type.unpack_rows(raw, array_field)
+
+    assert len(rows) == count
+    assert rows == packet_type.unpack_rows(full_raw, array_field)[:count]
+
+    if hasattr(packet, "names"):
+        assert packet.names() == [entry["name"] for entry in expected[array_field]]